@@ -0,0 +1,185 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+# distutils: extra_compile_args = -O3 -fopenmp
+# distutils: extra_link_args = -fopenmp
+"""
+Vincenty Geodesic Toolkit — optional C kernels (Cython)
+Same math as the kernels in vincenty.py, for use without Numba.
+Build in place with:  cythonize -i _vincenty.pyx
+"""
+
+from cython.parallel import prange
+from libc.math cimport sin, cos, tan, atan2, sqrt, fabs, fmod, pow, INFINITY, NAN
+
+# -------------------- WGS-84 CONSTANTS --------------------
+# C macros rather than cdef globals: the compiler folds them, and the derived
+# terms, into the arithmetic instead of reloading them on every call.
+cdef extern from *:
+    """
+    #define VINCENTY_A 6378137.0
+    #define VINCENTY_F (1 / 298.257223563)
+    #define VINCENTY_B (VINCENTY_A * (1 - VINCENTY_F))
+    #define VINCENTY_ONE_MINUS_F (1 - VINCENTY_F)
+    #define VINCENTY_EP2 ((VINCENTY_A * VINCENTY_A - VINCENTY_B * VINCENTY_B) / (VINCENTY_B * VINCENTY_B))
+    #define VINCENTY_F_16 (VINCENTY_F / 16)
+    #define VINCENTY_EPS 1e-12
+    #define VINCENTY_MAX_ITER 200
+    #define VINCENTY_STALL_RATIO 0.9
+    #define VINCENTY_STALL_ITER 10
+    #define VINCENTY_DEG (M_PI / 180.0)
+    """
+    const double a "VINCENTY_A"
+    const double f "VINCENTY_F"
+    const double b "VINCENTY_B"
+    const double ONE_MINUS_F "VINCENTY_ONE_MINUS_F"
+    const double EP2 "VINCENTY_EP2"  # second eccentricity squared
+    const double F_16 "VINCENTY_F_16"
+    const double EPS "VINCENTY_EPS"
+    const int MAX_ITER "VINCENTY_MAX_ITER"
+    const double STALL_RATIO "VINCENTY_STALL_RATIO"
+    const int STALL_ITER "VINCENTY_STALL_ITER"
+    const double DEG "VINCENTY_DEG"
+
+cdef inline double _wrap_lon(double lon) noexcept nogil:
+    cdef double r = fmod(lon + 180.0, 360.0)
+    return r + 180.0 if r < 0 else r - 180.0
+
+cdef inline double _wrap_azimuth(double az) noexcept nogil:
+    cdef double r = fmod(az, 360.0)
+    return r + 360.0 if r < 0 else r
+
+# =========================================================
+# Vincenty Inverse (Distance & Bearings)
+# =========================================================
+cpdef (double, double, double) inverse_c(double lat1, double lon1,
+                                         double lat2, double lon2) noexcept nogil:
+    """Inverse solution; returns (s, α1, α2), or NaNs if it fails to converge."""
+    cdef double L = (lon2 - lon1) * DEG
+    cdef double tanU1 = ONE_MINUS_F * tan(lat1 * DEG)
+    cdef double tanU2 = ONE_MINUS_F * tan(lat2 * DEG)
+    cdef double cosU1 = 1 / sqrt(1 + tanU1 * tanU1)
+    cdef double cosU2 = 1 / sqrt(1 + tanU2 * tanU2)
+    cdef double sinU1 = tanU1 * cosU1, sinU2 = tanU2 * cosU2
+    cdef double cU1cU2 = cosU1 * cosU2, sU1sU2 = sinU1 * sinU2
+    cdef double sU1cU2 = sinU1 * cosU2, cU1sU2 = cosU1 * sinU2
+    cdef double λ = L, λ_prev, sinλ = 0, cosλ = 1
+    cdef double sinσ = 0, cosσ = 1, σ = 0, sinα, cos2α = 1, cos2σm = 0, C
+    cdef double t, u2, A, B, Δσ, s, α1, α2, Δλ, Δλ_prev = INFINITY
+    cdef bint converged = False
+    cdef int i, stalled = 0
+    for i in range(MAX_ITER):
+        # gcc folds same-argument sin/cos into one sincos call
+        sinλ = sin(λ)
+        cosλ = cos(λ)
+        t = cU1sU2 - sU1cU2 * cosλ
+        sinσ = sqrt(cosU2 * sinλ * cosU2 * sinλ + t * t)
+        if sinσ == 0:
+            return 0.0, 0.0, 0.0
+        cosσ = sU1sU2 + cU1cU2 * cosλ
+        σ = atan2(sinσ, cosσ)
+        sinα = cU1cU2 * sinλ / sinσ
+        cos2α = 1 - sinα * sinα
+        cos2σm = 0.0 if cos2α == 0 else cosσ - 2 * sU1sU2 / cos2α
+        C = F_16 * cos2α * (4 + f * (4 - 3 * cos2α))
+        λ_prev = λ
+        λ = L + (1 - C) * f * sinα * (
+            σ + C * sinσ * (cos2σm + C * cosσ * (-1 + 2 * cos2σm * cos2σm))
+        )
+        Δλ = fabs(λ - λ_prev)
+        if Δλ < EPS:
+            converged = True
+            break
+        # No-progress exit, same rule as vincenty.py
+        stalled = stalled + 1 if Δλ > STALL_RATIO * Δλ_prev else 0
+        if stalled >= STALL_ITER and Δλ * pow(STALL_RATIO, MAX_ITER - 1 - i) >= EPS:
+            break
+        Δλ_prev = Δλ
+    if not converged:
+        return NAN, NAN, NAN
+
+    u2 = cos2α * EP2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    Δσ = B * sinσ * (
+        cos2σm + B / 4 * (cosσ * (-1 + 2 * cos2σm * cos2σm)
+        - B / 6 * cos2σm * (-3 + 4 * sinσ * sinσ) * (-3 + 4 * cos2σm * cos2σm))
+    )
+    s = b * A * (σ - Δσ)
+    # sinλ/cosλ from the last iteration: λ has moved by less than EPS since
+    α1 = atan2(cosU2 * sinλ, cU1sU2 - sU1cU2 * cosλ)
+    α2 = atan2(cosU1 * sinλ, -sU1cU2 + cU1sU2 * cosλ)
+    return s, _wrap_azimuth(α1 / DEG), _wrap_azimuth(α2 / DEG)
+
+# =========================================================
+# Vincenty Direct (Destination point)
+# =========================================================
+cpdef (double, double, double) direct_c(double lat1, double lon1,
+                                        double α1_deg, double s) noexcept nogil:
+    """Direct solution; returns (φ2, λ2, α2), or NaNs if it fails to converge."""
+    cdef double α1 = α1_deg * DEG
+    cdef double sinα1 = sin(α1), cosα1 = cos(α1)
+    cdef double tanU1 = ONE_MINUS_F * tan(lat1 * DEG)
+    cdef double cosU1 = 1 / sqrt(1 + tanU1 * tanU1)
+    cdef double sinU1 = tanU1 * cosU1
+    cdef double σ1 = atan2(tanU1, cosα1)
+    cdef double sinα = cosU1 * sinα1
+    cdef double cos2α = 1 - sinα * sinα
+    cdef double u2 = cos2α * EP2
+    cdef double A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    cdef double B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    cdef double C = F_16 * cos2α * (4 + f * (4 - 3 * cos2α))
+    cdef double σ0 = s / (b * A), σ = σ0, σ_prev
+    cdef double cos2σm = 0, sinσ, cosσ, Δσ, t, φ2, λ, L
+    cdef bint converged = False
+    cdef int i
+    for i in range(MAX_ITER):
+        cos2σm = cos(2 * σ1 + σ)
+        sinσ = sin(σ)
+        cosσ = cos(σ)
+        Δσ = B * sinσ * (
+            cos2σm + B / 4 * (cosσ * (-1 + 2 * cos2σm * cos2σm)
+            - B / 6 * cos2σm * (-3 + 4 * sinσ * sinσ) * (-3 + 4 * cos2σm * cos2σm))
+        )
+        σ_prev = σ
+        σ = σ0 + Δσ
+        if fabs(σ - σ_prev) < EPS:
+            converged = True
+            break
+    if not converged:
+        return NAN, NAN, NAN
+    sinσ = sin(σ)
+    cosσ = cos(σ)
+    t = sinU1 * sinσ - cosU1 * cosσ * cosα1
+    φ2 = atan2(sinU1 * cosσ + cosU1 * sinσ * cosα1,
+               ONE_MINUS_F * sqrt(sinα * sinα + t * t))
+    λ = atan2(sinσ * sinα1, cosU1 * cosσ - sinU1 * sinσ * cosα1)
+    L = λ - (1 - C) * f * sinα * (
+        σ + C * sinσ * (cos2σm + C * cosσ * (-1 + 2 * cos2σm * cos2σm))
+    )
+    return (φ2 / DEG, _wrap_lon(lon1 + L / DEG),
+            _wrap_azimuth(atan2(sinα, -t) / DEG))
+
+# =========================================================
+# Batch inverse over contiguous arrays (OpenMP)
+# =========================================================
+cdef void _inverse_batch(double[::1] lat1, double[::1] lon1,
+                         double[::1] lat2, double[::1] lon2,
+                         double[:, ::1] out) noexcept nogil:
+    cdef Py_ssize_t i, n = lat1.shape[0]
+    cdef double s, α1, α2
+    for i in prange(n, schedule='static'):
+        s, α1, α2 = inverse_c(lat1[i], lon1[i], lat2[i], lon2[i])
+        out[i, 0] = s
+        out[i, 1] = α1
+        out[i, 2] = α2
+
+def inverse_batch(double[::1] lat1, double[::1] lon1,
+                  double[::1] lat2, double[::1] lon2,
+                  double[:, ::1] out):
+    """Fill ``out[i] = (s, α1, α2)`` for every pair, spread over OpenMP threads."""
+    cdef Py_ssize_t n = lat1.shape[0]
+    if not (lon1.shape[0] == lat2.shape[0] == lon2.shape[0] == n):
+        raise ValueError("lat1, lon1, lat2 and lon2 must have the same length")
+    if out.shape[0] != n or out.shape[1] != 3:
+        raise ValueError(f"out must have shape ({n}, 3), got ({out.shape[0]}, {out.shape[1]})")
+    with nogil:
+        _inverse_batch(lat1, lon1, lat2, lon2, out)
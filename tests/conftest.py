@@ -0,0 +1,19 @@
+import sys
+from pathlib import Path
+
+import pytest
+
+# vincenty.py lives at the repository root rather than in a package
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import vincenty  # noqa: E402
+
+
+@pytest.fixture(params=["numba", "python"])
+def backend(request, monkeypatch):
+    """Run a test with the Numba kernels and again with Numba hidden."""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+    else:
+        monkeypatch.setattr(vincenty, "_HAVE_NUMBA", False)
+    return request.param
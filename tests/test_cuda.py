@@ -0,0 +1,31 @@
+"""
+The CUDA backend (vincenty_cuda.py) must agree with the scalar kernels.
+Needs a CUDA device, or the CPU simulator via NUMBA_ENABLE_CUDASIM=1.
+"""
+
+import numpy as np
+import pytest
+
+from reference import assert_inverse_close, pairs, scalar_inverse
+
+cuda = pytest.importorskip("numba.cuda")
+if not cuda.is_available():
+    pytest.skip("no CUDA device (set NUMBA_ENABLE_CUDASIM=1 for the simulator)",
+                allow_module_level=True)
+
+import vincenty_cuda  # noqa: E402  (needs numba.cuda)
+
+
+def test_inverse_matches_scalar():
+    lat1, lon1, lat2, lon2 = pairs(40, seed=4)
+    got = np.stack(vincenty_cuda.vincenty_inverse_cuda(lat1, lon1, lat2, lon2), axis=-1)
+    assert_inverse_close(got, scalar_inverse(lat1, lon1, lat2, lon2))
+
+
+def test_empty_and_broadcast_input():
+    s, α1, α2 = vincenty_cuda.vincenty_inverse_cuda(np.empty(0), 0, 0, 0)
+    assert s.shape == α1.shape == α2.shape == (0,)
+    lat2 = np.array([[10.0, 20.0], [-30.0, 40.0]])
+    got = np.stack(vincenty_cuda.vincenty_inverse_cuda(0, 0, lat2, 50), axis=-1)
+    assert got.shape == (2, 2, 3)
+    assert_inverse_close(got, scalar_inverse(0, 0, lat2, 50))
@@ -0,0 +1,36 @@
+"""
+The optional Cython kernels (_vincenty.pyx) must agree with the scalar
+Python ones; skipped unless the extension has been built.
+"""
+
+import numpy as np
+import pytest
+
+import vincenty
+from reference import assert_inverse_close, pairs, scalar_inverse
+
+_vincenty = pytest.importorskip("_vincenty")
+
+
+def test_inverse_matches_scalar():
+    lat1, lon1, lat2, lon2 = pairs(200, seed=3)
+    want = scalar_inverse(lat1, lon1, lat2, lon2)
+    assert_inverse_close([_vincenty.inverse_c(*p) for p in zip(lat1, lon1, lat2, lon2)], want)
+    out = np.empty((lat1.size, 3))
+    _vincenty.inverse_batch(*(np.ascontiguousarray(x) for x in (lat1, lon1, lat2, lon2)), out)
+    assert_inverse_close(out, want)
+
+
+def test_direct_matches_scalar():
+    for d in (0.0, 1e5, 1.5e7):
+        np.testing.assert_allclose(_vincenty.direct_c(10, 20, 30, d),
+                                   vincenty.vincenty_direct(10, 20, 30, d), atol=1e-9)
+
+
+def test_batch_rejects_mismatched_shapes():
+    x = np.zeros(100)
+    with pytest.raises(ValueError):
+        _vincenty.inverse_batch(x, x, x, np.zeros(99), np.empty((100, 3)))
+    for shape in [(1, 3), (101, 3), (100, 2)]:
+        with pytest.raises(ValueError):
+            _vincenty.inverse_batch(x, x, x, x, np.empty(shape))
@@ -0,0 +1,40 @@
+"""
+distance_matrix must match the scalar inverse whatever the tiling.
+"""
+
+import numpy as np
+import pytest
+
+import vincenty
+from reference import FAILING, SPECIAL, scalar_inverse
+
+
+def test_matches_scalar(backend):
+    P = np.array(FAILING + SPECIAL)[:, :2]
+    Q = np.array(FAILING + SPECIAL)[:, 2:]
+    want = scalar_inverse(P[:, 0, None], P[:, 1, None], Q[None, :, 0], Q[None, :, 1])[..., 0]
+    for max_pairs in (1, 7, 1 << 14):  # ragged tiles, row tiles, one tile
+        got = vincenty.distance_matrix(P, Q, max_pairs=max_pairs)
+        np.testing.assert_allclose(got, want, rtol=0, atol=1e-6)
+
+
+def test_empty_input():
+    Q = np.array([[0.0, 0.0], [10.0, 20.0]])
+    assert vincenty.distance_matrix(np.empty((0, 2)), Q).shape == (0, 2)
+    assert vincenty.distance_matrix(Q, np.empty((0, 2))).shape == (2, 0)
+
+
+def test_single_point_is_one_row():
+    Q = np.array([[0.0, 0.0], [10.0, 20.0]])
+    np.testing.assert_allclose(vincenty.distance_matrix([10.0, 20.0], Q),
+                               vincenty.distance_matrix([[10.0, 20.0]], Q))
+    assert vincenty.distance_matrix(Q, (0.0, 0.0)).shape == (2, 1)
+
+
+def test_rejects_wrong_shapes():
+    Q = np.array([[0.0, 0.0], [10.0, 20.0]])
+    for bad in (np.zeros((4, 3)), np.zeros(6), np.zeros((2, 2, 2)), np.zeros((3, 1))):
+        with pytest.raises(ValueError):
+            vincenty.distance_matrix(bad, Q)
+        with pytest.raises(ValueError):
+            vincenty.distance_matrix(Q, bad)
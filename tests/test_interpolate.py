@@ -0,0 +1,45 @@
+"""
+vincenty_interpolate reads a points CSV, places each distance along the
+geodesic and writes interpolated_points.csv next to the input.
+"""
+
+import csv
+
+import numpy as np
+import pytest
+
+import vincenty
+
+START, END = (23.776939, 97.724721), (24.374530, 84.144159)
+
+
+def write_points(path, distances):
+    # Same layout as examples/sample_points.csv: CRLF rows and an extra column
+    lines = ["serial no,distance,DL"]
+    lines += [f"{serial},{d},{i}" for i, (serial, d) in enumerate(distances)]
+    path.write_bytes(("\r\n".join(lines) + "\r\n").encode())
+
+
+@pytest.mark.parametrize("n", [5, 150])  # scalar-loop and NumPy direct paths
+def test_interpolate_csv(backend, tmp_path, n):
+    total = vincenty.vincenty_inverse(*START, *END)[0]
+    distances = [("1", 0), ("2", 25)] + [(f"P{i}", round(d, 3))
+                                         for i, d in enumerate(np.linspace(50, total, n))]
+    points = tmp_path / "points.csv"
+    write_points(points, distances)
+
+    vincenty.vincenty_interpolate(*START, *END, str(points))
+
+    with open(tmp_path / "interpolated_points.csv", newline='') as fh:
+        rows = list(csv.reader(fh))
+    assert rows[0] == ["serial no", "distance", "latitude", "longitude"]
+    assert len(rows) == len(distances) + 1
+    α1 = vincenty.vincenty_inverse(*START, *END)[1]
+    for (serial, d), (out_serial, out_d, lat, lon) in zip(distances, rows[1:]):
+        assert out_serial == serial
+        assert float(out_d) == pytest.approx(d, abs=5e-4)
+        φ2, λ2, _ = vincenty.vincenty_direct(*START, α1, float(d))
+        assert float(lat) == pytest.approx(φ2, abs=1e-8)
+        assert float(lon) == pytest.approx(λ2, abs=1e-8)
+    # The last distance is the full length, so that row lands on the end point
+    np.testing.assert_allclose([float(x) for x in rows[-1][2:]], END, atol=1e-6)
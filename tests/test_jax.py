@@ -0,0 +1,41 @@
+"""
+The JAX backend (vincenty_jax.py) must agree with the scalar kernels and
+refuse to run without JAX's 64-bit mode.
+"""
+
+import numpy as np
+import pytest
+
+from reference import assert_inverse_close, pairs, scalar_inverse
+
+jax = pytest.importorskip("jax")
+
+import vincenty_jax  # noqa: E402  (needs jax)
+
+
+@pytest.fixture
+def x64():
+    """Set JAX's 64-bit mode for one test and restore the caller's setting."""
+    previous = jax.config.jax_enable_x64
+    yield lambda on: jax.config.update("jax_enable_x64", on)
+    jax.config.update("jax_enable_x64", previous)
+
+
+def test_import_leaves_x64_alone():
+    import importlib
+    previous = jax.config.jax_enable_x64
+    importlib.reload(vincenty_jax)
+    assert jax.config.jax_enable_x64 == previous
+
+
+def test_requires_x64(x64):
+    x64(False)
+    with pytest.raises(RuntimeError):
+        vincenty_jax.inverse_batch(np.zeros(2), np.zeros(2), np.ones(2), np.ones(2))
+
+
+def test_inverse_matches_scalar(x64):
+    x64(True)
+    lat1, lon1, lat2, lon2 = pairs(200, seed=5)
+    got = np.asarray(vincenty_jax.inverse_batch(lat1, lon1, lat2, lon2))
+    assert_inverse_close(got, scalar_inverse(lat1, lon1, lat2, lon2))
@@ -0,0 +1,47 @@
+"""
+The no-progress exit (STALL_RATIO / STALL_ITER) must only cut short pairs
+that could not have converged within MAX_ITER anyway.
+"""
+
+import numpy as np
+
+import vincenty
+from reference import assert_inverse_close, scalar_inverse
+
+# Nearly antipodal pairs that stall for more than STALL_ITER iterations yet
+# still converge before MAX_ITER; a bare stall counter would drop them.
+SLOW = [(-23.6765, 0, 24.2345, 179.9723), (1.6763, 0, -1.009, 179.9578),
+        (9.189, 0, -9.8383, 179.9638), (-52.2843, 0, 52.5323, 179.9468)]
+
+
+def near_antipodal(n, seed=0):
+    rng = np.random.default_rng(seed)
+    lat1 = rng.uniform(-60, 60, n)
+    lat2 = -lat1 + rng.uniform(-1, 1, n)
+    pts = np.array([lat1, np.zeros(n), lat2, rng.uniform(178.5, 180, n)])
+    return np.concatenate([pts, np.array(SLOW).T], axis=1)
+
+
+def full_iteration(monkeypatch, *pairs):
+    """Scalar reference with the stall exit switched off."""
+    with monkeypatch.context() as m:
+        m.setattr(vincenty, "STALL_ITER", vincenty.MAX_ITER + 1)
+        return scalar_inverse(*pairs)
+
+
+def test_slow_pairs_converge(backend):
+    lat1, lon1, lat2, lon2 = np.array(SLOW).T
+    assert not np.isnan(scalar_inverse(lat1, lon1, lat2, lon2)).any()
+    for n in (1, 200):  # scalar-loop and NumPy paths of vincenty_inverse_vec
+        tiled = (np.tile(x, n) for x in (lat1, lon1, lat2, lon2))
+        assert not np.isnan(vincenty.vincenty_inverse_vec(*tiled)).any()
+    assert not np.isnan(vincenty.distance_array(lat1, lon1, lat2, lon2)).any()
+
+
+def test_stall_exit_changes_no_outcome(backend, monkeypatch):
+    lat1, lon1, lat2, lon2 = near_antipodal(400)
+    want = full_iteration(monkeypatch, lat1, lon1, lat2, lon2)
+    assert np.isnan(want[:, 0]).any() and not np.isnan(want[:, 0]).all()
+    assert_inverse_close(scalar_inverse(lat1, lon1, lat2, lon2), want)
+    assert_inverse_close(np.stack(vincenty.vincenty_inverse_vec(lat1, lon1, lat2, lon2), axis=-1), want)
+    assert_inverse_close(vincenty.distance_array(lat1, lon1, lat2, lon2), want)
@@ -0,0 +1,84 @@
+"""
+Regression tests: the batch functions must agree with the scalar
+vincenty_inverse / vincenty_direct, including the awkward cases.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+import vincenty
+from reference import FAILING, POLE_TO_POLE, assert_inverse_close, pairs, scalar_inverse
+
+
+def test_scalar_failures_raise():
+    for pair in FAILING:
+        with pytest.raises(ValueError):
+            vincenty.vincenty_inverse(*pair)
+
+
+def test_scalar_special_cases():
+    assert vincenty.vincenty_inverse(0, 0, 0, 0) == (0.0, 0.0, 0.0)
+    s, α1, α2 = vincenty.vincenty_inverse(90, 0, -90, 0)
+    assert s == pytest.approx(POLE_TO_POLE, abs=1e-3)
+    assert (α1, α2) == (180.0, 180.0)
+
+
+def test_normalizers_accept_arrays():
+    np.testing.assert_allclose(vincenty.normalize_lon(np.array([190.0, -190.0])), [-170, 170])
+    np.testing.assert_allclose(vincenty.normalize_azimuth(np.array([-10.0, 370.0])), [350, 10])
+
+
+@pytest.mark.parametrize("n", [8, 1000])  # either side of the small-batch cutoff
+def test_inverse_vec_matches_scalar(backend, n):
+    lat1, lon1, lat2, lon2 = pairs(n)
+    got = np.stack(vincenty.vincenty_inverse_vec(lat1, lon1, lat2, lon2), axis=-1)
+    assert_inverse_close(got, scalar_inverse(lat1, lon1, lat2, lon2))
+
+
+def test_inverse_vec_broadcasts(backend):
+    lat2, lon2 = np.array([[0, 10, 90], [-45, 0.5, 23.7]]), np.array([[0, 20, 0], [170, 179.7, 97.7]])
+    s, α1, α2 = vincenty.vincenty_inverse_vec(0, 0, lat2, lon2)
+    assert s.shape == α1.shape == α2.shape == (2, 3)
+    assert_inverse_close(np.stack([s, α1, α2], axis=-1), scalar_inverse(0, 0, lat2, lon2))
+
+
+def test_distance_array_matches_scalar(backend):
+    lat1, lon1, lat2, lon2 = pairs(500, seed=1)
+    got = vincenty.distance_array(lat1, lon1, lat2, lon2)
+    assert got.shape == (lat1.size, 3)
+    assert_inverse_close(got, scalar_inverse(lat1, lon1, lat2, lon2))
+
+
+@pytest.mark.parametrize("n", [8, 1000])
+def test_direct_vec_matches_scalar(backend, n):
+    s = np.concatenate([[0.0, 1.0, POLE_TO_POLE], np.linspace(0, 4e7, n)])
+    for lat1, lon1, α1 in [(23.776939, 97.724721, 275.512), (0, 0, 90), (-89.5, 170, 10)]:
+        got = np.stack(vincenty.vincenty_direct_vec(lat1, lon1, α1, s), axis=-1)
+        want = np.array([vincenty.vincenty_direct(lat1, lon1, α1, d) for d in s])
+        np.testing.assert_allclose(got[:, 0], want[:, 0], rtol=0, atol=1e-9)
+        dλα = (got[:, 1:] - want[:, 1:] + 180) % 360 - 180
+        np.testing.assert_allclose(dλα, 0, atol=1e-9)
+
+
+def test_direct_inverts_inverse():
+    lat1, lon1, lat2, lon2 = pairs(50, seed=2)[:, :50]
+    s, α1, _ = vincenty.vincenty_inverse_vec(lat1, lon1, lat2, lon2)
+    for i in range(50):
+        φ2, λ2, _ = vincenty.vincenty_direct(lat1[i], lon1[i], α1[i], s[i])
+        assert φ2 == pytest.approx(lat2[i], abs=1e-8)
+        assert (λ2 - lon2[i] + 180) % 360 - 180 == pytest.approx(0, abs=1e-8)
+
+
+def test_numpy_batch_paths_skip_numba():
+    # Large batches run on NumPy alone; importing Numba would cost the CLI ~0.5 s
+    code = ("import sys, numpy as np, vincenty\n"
+            "x = np.linspace(0, 60, 2000)\n"
+            "vincenty.vincenty_inverse_vec(x, x, x + 1, x + 2)\n"
+            "vincenty.vincenty_direct_vec(10, 20, 30, x * 1e5)\n"
+            "assert 'numba' not in sys.modules, 'numba imported'\n")
+    subprocess.run([sys.executable, "-c", code], check=True,
+                   cwd=Path(vincenty.__file__).resolve().parent)
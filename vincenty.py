@@ -6,17 +6,46 @@ Implements Direct, Inverse, and Interpolation on the WGS-84 ellipsoid.
 Author: MD Rokonuzzaman, rokon.mist17@gmail.com
 """
 
+import csv
 import math
-import argparse
-import pandas as pd
+import numpy as np
+from importlib.util import find_spec
 from pathlib import Path
+from types import FunctionType
+
+# Numba is optional and only imported by _jit(), on the first batch call:
+# loading even cached kernels costs more than a whole single-pair CLI run.
+_HAVE_NUMBA = find_spec("numba") is not None
 
 # -------------------- WGS-84 CONSTANTS --------------------
 a = 6378137.0
 f = 1 / 298.257223563
 b = a * (1 - f)
+# Derived ellipsoid terms. Numba freezes module globals into the compiled
+# kernels as literals, so these fold into the arithmetic at compile time;
+# the pure-Python and NumPy paths just skip recomputing them on every call.
+ONE_MINUS_F = 1 - f
+EP2 = (a * a - b * b) / (b * b)  # second eccentricity squared
+F_16 = f / 16
 EPS = 1e-12
 MAX_ITER = 200
+# Give up early on pairs that stop making progress (nearly antipodal points):
+# after STALL_ITER iterations in a row where |Δλ| shrank by less than
+# STALL_RATIO, bail if even that rate could not reach EPS within MAX_ITER.
+STALL_RATIO = 0.9
+STALL_ITER = 10
+# Below these many rows the batch paths loop over the scalar kernel instead:
+# per-ufunc call overhead outweighs NumPy's SIMD trig loops on small arrays.
+# A compiled (Numba or Cython) scalar kernel stays ahead for much longer than
+# plain Python; crossovers measured per pair on x86-64 with NumPy 2.x.
+SIMD_MIN_BATCH = 32                # plain-Python kernels
+SIMD_MIN_BATCH_INVERSE_JIT = 384   # compiled inverse kernel
+SIMD_MIN_BATCH_DIRECT_JIT = 96     # compiled direct step
+
+# -------------------- NUMBA KERNELS --------------------
+# Keep NaN/inf semantics (no 'nnan'/'ninf'): unconverged pairs come back as NaN.
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+_SIG_TRIPLE = "UniTuple(float64, 3)(float64, float64, float64, float64)"
 
 # =========================================================
 # Helper functions
@@ -26,101 +55,434 @@ def to_degrees(rad): return math.degrees(rad)
 def normalize_lon(lon): return (lon + 180) % 360 - 180
 def normalize_azimuth(az): return az % 360
 
+def normalize_lon_vec(lon):
+    r = np.fmod(np.add(lon, 180.0), 360.0)
+    r += (r < 0) * 360.0
+    r -= 180.0
+    return r
+
+def normalize_azimuth_vec(az): return np.remainder(az, 360.0)
+
 # =========================================================
 # Vincenty Inverse (Distance & Bearings)
 # =========================================================
-def vincenty_inverse(lat1, lon1, lat2, lon2):
-    φ1, φ2 = map(to_radians, [lat1, lat2])
-    L = to_radians(lon2 - lon1)
-    U1 = math.atan((1 - f) * math.tan(φ1))
-    U2 = math.atan((1 - f) * math.tan(φ2))
-    sinU1, cosU1 = math.sin(U1), math.cos(U1)
-    sinU2, cosU2 = math.sin(U2), math.cos(U2)
+def _inverse_kernel(lat1, lon1, lat2, lon2):
+    φ1, φ2 = math.radians(lat1), math.radians(lat2)
+    L = math.radians(lon2 - lon1)
+    tanU1 = ONE_MINUS_F * math.tan(φ1)
+    tanU2 = ONE_MINUS_F * math.tan(φ2)
+    cosU1 = 1 / math.sqrt(1 + tanU1 * tanU1)
+    cosU2 = 1 / math.sqrt(1 + tanU2 * tanU2)
+    sinU1, sinU2 = tanU1 * cosU1, tanU2 * cosU2
+    # Loop invariants
+    cU1cU2, sU1sU2 = cosU1 * cosU2, sinU1 * sinU2
+    sU1cU2, cU1sU2 = sinU1 * cosU2, cosU1 * sinU2
     λ = L
-    for _ in range(MAX_ITER):
-        sinλ = math.sin(λ)
-        cosλ = math.cos(λ)
-        sinσ = math.sqrt((cosU2 * sinλ)**2 +
-                         (cosU1 * sinU2 - sinU1 * cosU2 * cosλ)**2)
+    sinλ, cosλ = 0.0, 1.0  # read again after the loop for the bearings
+    Δλ_prev = math.inf
+    stalled = 0
+    converged = False
+    for it in range(MAX_ITER):
+        sinλ, cosλ = math.sin(λ), math.cos(λ)
+        sl = cosU2 * sinλ
+        t = cU1sU2 - sU1cU2 * cosλ
+        sinσ = math.sqrt(sl * sl + t * t)
         if sinσ == 0:
-            return 0, 0, 0
-        cosσ = sinU1 * sinU2 + cosU1 * cosU2 * cosλ
+            return 0.0, 0.0, 0.0
+        cosσ = sU1sU2 + cU1cU2 * cosλ
         σ = math.atan2(sinσ, cosσ)
-        sinα = cosU1 * cosU2 * sinλ / sinσ
-        cos2α = 1 - sinα**2
-        cos2σm = 0 if cos2α == 0 else cosσ - 2 * sinU1 * sinU2 / cos2α
-        C = f / 16 * cos2α * (4 + f * (4 - 3 * cos2α))
+        sinα = cU1cU2 * sinλ / sinσ
+        cos2α = 1 - sinα * sinα
+        cos2σm = 0.0 if cos2α == 0 else cosσ - 2 * sU1sU2 / cos2α
+        C = F_16 * cos2α * (4 + f * (4 - 3 * cos2α))
         λ_prev = λ
         λ = L + (1 - C) * f * sinα * (
-            σ + C * sinσ * (cos2σm + C * cosσ * (-1 + 2 * cos2σm**2))
+            σ + C * sinσ * (cos2σm + C * cosσ * (-1 + 2 * cos2σm * cos2σm))
         )
-        if abs(λ - λ_prev) < EPS:
+        Δλ = abs(λ - λ_prev)
+        if Δλ < EPS:
+            converged = True
             break
-    else:
-        raise ValueError("Vincenty inverse formula failed to converge")
+        stalled = stalled + 1 if Δλ > STALL_RATIO * Δλ_prev else 0
+        if stalled >= STALL_ITER and Δλ * STALL_RATIO ** (MAX_ITER - 1 - it) >= EPS:
+            break
+        Δλ_prev = Δλ
+    if not converged:
+        return math.nan, math.nan, math.nan
 
-    u2 = cos2α * (a**2 - b**2) / (b**2)
+    u2 = cos2α * EP2
     A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
     B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
     Δσ = B * sinσ * (
-        cos2σm + B / 4 * (cosσ * (-1 + 2 * cos2σm**2)
-        - B / 6 * cos2σm * (-3 + 4 * sinσ**2) * (-3 + 4 * cos2σm**2))
+        cos2σm + B / 4 * (cosσ * (-1 + 2 * cos2σm * cos2σm)
+        - B / 6 * cos2σm * (-3 + 4 * sinσ * sinσ) * (-3 + 4 * cos2σm * cos2σm))
     )
     s = b * A * (σ - Δσ)
-    α1 = math.atan2(cosU2 * math.sin(λ),
-                    cosU1 * sinU2 - sinU1 * cosU2 * math.cos(λ))
-    α2 = math.atan2(cosU1 * math.sin(λ),
-                    -sinU1 * cosU2 + cosU1 * sinU2 * math.cos(λ))
-    return s, normalize_azimuth(to_degrees(α1)), normalize_azimuth(to_degrees(α2))
+    # sinλ/cosλ from the last iteration: λ has moved by less than EPS since
+    α1 = math.atan2(cosU2 * sinλ, cU1sU2 - sU1cU2 * cosλ)
+    α2 = math.atan2(cosU1 * sinλ, -sU1cU2 + cU1sU2 * cosλ)
+    return s, normalize_azimuth(math.degrees(α1)), normalize_azimuth(math.degrees(α2))
+
+def vincenty_inverse(lat1, lon1, lat2, lon2):
+    s, α1, α2 = _inverse_kernel(lat1, lon1, lat2, lon2)
+    if math.isnan(s):
+        raise ValueError("Vincenty inverse formula failed to converge")
+    return s, α1, α2
 
 # =========================================================
 # Vincenty Direct (Destination point)
 # =========================================================
-def vincenty_direct(lat1, lon1, α1_deg, s):
-    φ1 = to_radians(lat1)
-    λ1 = to_radians(lon1)
-    α1 = to_radians(α1_deg)
+def _direct_prep(lat1, lon1, α1_deg):
+    """Terms of the direct problem that depend only on the origin and bearing."""
+    λ1 = math.radians(lon1)
+    α1 = math.radians(α1_deg)
     sinα1, cosα1 = math.sin(α1), math.cos(α1)
-    tanU1 = (1 - f) * math.tan(φ1)
-    cosU1 = 1 / math.sqrt(1 + tanU1**2)
+    tanU1 = ONE_MINUS_F * math.tan(math.radians(lat1))
+    cosU1 = 1 / math.sqrt(1 + tanU1 * tanU1)
     sinU1 = tanU1 * cosU1
     σ1 = math.atan2(tanU1, cosα1)
     sinα = cosU1 * sinα1
-    cos2α = 1 - sinα**2
-    u2 = cos2α * (a**2 - b**2) / b**2
+    cos2α = 1 - sinα * sinα
+    u2 = cos2α * EP2
     A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
     B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
-    σ = s / (b * A)
+    C = F_16 * cos2α * (4 + f * (4 - 3 * cos2α))
+    return λ1, sinU1, cosU1, sinα1, cosα1, sinα, 2 * σ1, b * A, B, C
+
+def _direct_step(prep, s):
+    """Destination at distance ``s`` from a ``_direct_prep`` origin."""
+    λ1, sinU1, cosU1, sinα1, cosα1, sinα, two_σ1, bA, B, C = prep
+    # Loop invariants
+    σ0 = s / bA
+    B_4, B_6 = B / 4, B / 6
+    σ = σ0
+    converged = False
     for _ in range(MAX_ITER):
-        cos2σm = math.cos(2 * σ1 + σ)
-        sinσ = math.sin(σ)
-        cosσ = math.cos(σ)
+        cos2σm = math.cos(two_σ1 + σ)
+        sinσ, cosσ = math.sin(σ), math.cos(σ)
         Δσ = B * sinσ * (
-            cos2σm + B / 4 * (cosσ * (-1 + 2 * cos2σm**2)
-            - B / 6 * cos2σm * (-3 + 4 * sinσ**2) * (-3 + 4 * cos2σm**2))
+            cos2σm + B_4 * (cosσ * (-1 + 2 * cos2σm * cos2σm)
+            - B_6 * cos2σm * (-3 + 4 * sinσ * sinσ) * (-3 + 4 * cos2σm * cos2σm))
         )
         σ_prev = σ
-        σ = s / (b * A) + Δσ
+        σ = σ0 + Δσ
         if abs(σ - σ_prev) < EPS:
+            converged = True
             break
-    else:
-        raise ValueError("Vincenty direct formula failed to converge")
+    if not converged:
+        return math.nan, math.nan, math.nan
     sinσ, cosσ = math.sin(σ), math.cos(σ)
+    t = sinU1 * sinσ - cosU1 * cosσ * cosα1
     φ2 = math.atan2(
         sinU1 * cosσ + cosU1 * sinσ * cosα1,
-        (1 - f) * math.sqrt(sinα**2 + (sinU1 * sinσ - cosU1 * cosσ * cosα1)**2)
+        ONE_MINUS_F * math.sqrt(sinα * sinα + t * t)
     )
     λ = math.atan2(
         sinσ * sinα1,
         cosU1 * cosσ - sinU1 * sinσ * cosα1
     )
-    C = f / 16 * cos2α * (4 + f * (4 - 3 * cos2α))
     L = λ - (1 - C) * f * sinα * (
-        σ + C * sinσ * (cos2σm + C * cosσ * (-1 + 2 * cos2σm**2))
+        σ + C * sinσ * (cos2σm + C * cosσ * (-1 + 2 * cos2σm * cos2σm))
     )
     λ2 = λ1 + L
-    α2 = math.atan2(sinα, - (sinU1 * sinσ - cosU1 * cosσ * cosα1))
-    return to_degrees(φ2), normalize_lon(to_degrees(λ2)), normalize_azimuth(to_degrees(α2))
+    α2 = math.atan2(sinα, -t)
+    return math.degrees(φ2), normalize_lon(math.degrees(λ2)), normalize_azimuth(math.degrees(α2))
+
+def _direct_kernel(lat1, lon1, α1_deg, s):
+    return _direct_step(_direct_prep(lat1, lon1, α1_deg), s)
+
+def vincenty_direct(lat1, lon1, α1_deg, s):
+    φ2, λ2, α2 = _direct_kernel(lat1, lon1, α1_deg, s)
+    if math.isnan(φ2):
+        raise ValueError("Vincenty direct formula failed to converge")
+    return φ2, λ2, α2
+
+# Without Numba, use the Cython kernels from _vincenty.pyx if they have been built.
+_inverse_batch = None
+if not _HAVE_NUMBA:
+    try:
+        from _vincenty import direct_c as _direct_kernel
+        from _vincenty import inverse_batch as _inverse_batch
+        from _vincenty import inverse_c as _inverse_kernel
+    except ImportError:  # not built; stay on the pure-Python kernels
+        pass
+
+# =========================================================
+# Vectorized Vincenty Inverse (arrays of point pairs)
+# =========================================================
+def vincenty_inverse_vec(lat1, lon1, lat2, lon2):
+    """Vincenty inverse over arrays of point pairs.
+
+    Inputs broadcast against each other; returns ``(s, α1, α2)`` arrays of
+    the broadcast shape. Each iteration only touches the rows that have not
+    converged yet. Rows that never converge come back as NaN instead of
+    raising, so a single near-antipodal pair does not sink the whole batch.
+
+    Iteration counts are skewed: typical pairs converge in ~5 iterations
+    while nearly antipodal ones can take up to ``MAX_ITER``. The shrinking
+    active set keeps those stragglers from costing a full pass each time,
+    and the stall check drops pairs that are not going to converge.
+    """
+    arrays = np.broadcast_arrays(
+        *(np.asarray(x, dtype=np.float64) for x in (lat1, lon1, lat2, lon2)))
+    shape = arrays[0].shape
+    # Unit-stride inputs keep the ufuncs on their SIMD inner loops
+    lat1, lon1, lat2, lon2 = (np.ascontiguousarray(x).ravel() for x in arrays)
+    compiled = _HAVE_NUMBA or _inverse_batch is not None  # Numba or Cython
+    if lat1.size < (SIMD_MIN_BATCH_INVERSE_JIT if compiled else SIMD_MIN_BATCH):
+        jit = _jit()
+        kernel = _inverse_kernel if jit is None else jit["_inverse_kernel"]
+        out = np.empty((lat1.size, 3))
+        for i in range(lat1.size):
+            out[i] = kernel(lat1[i], lon1[i], lat2[i], lon2[i])
+        return tuple(out[:, k].reshape(shape) for k in range(3))
+    φ1 = np.radians(lat1)
+    φ2 = np.radians(lat2)
+    L = np.radians(lon2 - lon1)
+    tanU1 = ONE_MINUS_F * np.tan(φ1)
+    tanU2 = ONE_MINUS_F * np.tan(φ2)
+    cosU1 = 1 / np.sqrt(1 + tanU1 * tanU1)
+    cosU2 = 1 / np.sqrt(1 + tanU2 * tanU2)
+    sinU1, sinU2 = tanU1 * cosU1, tanU2 * cosU2
+
+    n = L.size
+    λ = L.copy()
+    sinσ = np.zeros(n)
+    cosσ = np.ones(n)
+    σ = np.zeros(n)
+    cos2α = np.ones(n)
+    cos2σm = np.zeros(n)
+    Δλ_prev = np.full(n, np.inf)
+    stalled = np.zeros(n, dtype=np.int64)
+    active = np.ones(n, dtype=bool)
+    failed = np.zeros(n, dtype=bool)
+    for it in range(MAX_ITER):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        sU1, cU1, sU2, cU2 = sinU1[idx], cosU1[idx], sinU2[idx], cosU2[idx]
+        λ_prev = λ[idx]
+        sinλ = np.sin(λ_prev)
+        cosλ = np.cos(λ_prev)
+        sinσ_i = np.hypot(cU2 * sinλ, cU1 * sU2 - sU1 * cU2 * cosλ)
+        cosσ_i = sU1 * sU2 + cU1 * cU2 * cosλ
+        σ_i = np.arctan2(sinσ_i, cosσ_i)
+        # Coincident points (sinσ == 0) divide by 1 instead: sinα = 0 keeps
+        # λ at L, so those rows converge on their own and are zeroed below.
+        sinσ_safe = np.where(sinσ_i == 0, 1.0, sinσ_i)
+        sinα = cU1 * cU2 * sinλ / sinσ_safe
+        cos2α_i = 1 - sinα * sinα
+        cos2σm_i = np.zeros_like(cos2α_i)
+        np.divide(2 * sU1 * sU2, cos2α_i, out=cos2σm_i, where=cos2α_i != 0)
+        np.subtract(cosσ_i, cos2σm_i, out=cos2σm_i, where=cos2α_i != 0)
+        C = F_16 * cos2α_i * (4 + f * (4 - 3 * cos2α_i))
+        # λ = L + (1 - C) f sinα (σ + C sinσ (cos2σm + C cosσ (2 cos²2σm - 1)))
+        λ_new = 2 * cos2σm_i * cos2σm_i
+        λ_new -= 1
+        λ_new *= C * cosσ_i
+        λ_new += cos2σm_i
+        λ_new *= C * sinσ_i
+        λ_new += σ_i
+        λ_new *= (1 - C) * f * sinα
+        λ_new += L[idx]
+
+        sinσ[idx], cosσ[idx], σ[idx] = sinσ_i, cosσ_i, σ_i
+        cos2α[idx], cos2σm[idx] = cos2α_i, cos2σm_i
+        λ[idx] = λ_new
+        Δλ = np.abs(λ_new - λ_prev)
+        st = np.where(Δλ > STALL_RATIO * Δλ_prev[idx], stalled[idx] + 1, 0)
+        give_up = (st >= STALL_ITER) & (Δλ * STALL_RATIO ** (MAX_ITER - 1 - it) >= EPS)
+        stalled[idx], Δλ_prev[idx] = st, Δλ
+        failed[idx] = give_up
+        active[idx] = (Δλ >= EPS) & ~give_up
+
+    u2 = cos2α * EP2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    Δσ = B * sinσ * (
+        cos2σm + B / 4 * (cosσ * (-1 + 2 * cos2σm * cos2σm)
+        - B / 6 * cos2σm * (-3 + 4 * sinσ * sinσ) * (-3 + 4 * cos2σm * cos2σm))
+    )
+    s = b * A * (σ - Δσ)
+    sinλ, cosλ = np.sin(λ), np.cos(λ)
+    α1 = np.arctan2(cosU2 * sinλ, cosU1 * sinU2 - sinU1 * cosU2 * cosλ)
+    α2 = np.arctan2(cosU1 * sinλ, -sinU1 * cosU2 + cosU1 * sinU2 * cosλ)
+    α1 = normalize_azimuth_vec(np.degrees(α1))
+    α2 = normalize_azimuth_vec(np.degrees(α2))
+    zero_mask = sinσ == 0
+    s = np.where(zero_mask, 0.0, s)
+    α1 = np.where(zero_mask, 0.0, α1)
+    α2 = np.where(zero_mask, 0.0, α2)
+    failed |= active
+    s[failed] = α1[failed] = α2[failed] = np.nan
+    return s.reshape(shape), α1.reshape(shape), α2.reshape(shape)
+
+# =========================================================
+# Vectorized Vincenty Direct (many distances, one origin)
+# =========================================================
+def vincenty_direct_vec(lat1, lon1, α1_deg, s):
+    """Vincenty direct for a single origin and bearing over an array of distances.
+
+    Everything that depends only on the origin and bearing is computed once;
+    the σ iteration runs over the distances that have not converged yet.
+    Returns ``(φ2, λ2, α2)`` arrays shaped like ``s``.
+    """
+    s = np.asarray(s, dtype=np.float64)
+    shape = s.shape
+    s = np.ascontiguousarray(s).ravel()
+    prep = _direct_prep(lat1, lon1, α1_deg)
+    if s.size < (SIMD_MIN_BATCH_DIRECT_JIT if _HAVE_NUMBA else SIMD_MIN_BATCH):
+        jit = _jit()
+        step = _direct_step if jit is None else jit["_direct_step"]
+        out = np.empty((s.size, 3))
+        for i in range(s.size):
+            out[i] = step(prep, s[i])
+        return tuple(out[:, k].reshape(shape) for k in range(3))
+    λ1, sinU1, cosU1, sinα1, cosα1, sinα, two_σ1, bA, B, C = prep
+
+    σ0 = s / bA
+    σ = σ0.copy()
+    cos2σm = np.empty_like(σ)
+    active = np.ones(s.size, dtype=bool)
+    for _ in range(MAX_ITER):
+        idx = np.flatnonzero(active)
+        if idx.size == 0:
+            break
+        σ_prev = σ[idx]
+        c2σm = np.cos(two_σ1 + σ_prev)
+        sinσ = np.sin(σ_prev)
+        cosσ = np.cos(σ_prev)
+        c2σm2 = c2σm * c2σm
+        Δσ = B / 6 * c2σm * (-3 + 4 * sinσ * sinσ) * (-3 + 4 * c2σm2)
+        np.subtract(cosσ * (2 * c2σm2 - 1), Δσ, out=Δσ)
+        Δσ *= B / 4
+        Δσ += c2σm
+        Δσ *= B * sinσ
+        Δσ += σ0[idx]
+        σ[idx] = Δσ
+        cos2σm[idx] = c2σm
+        active[idx] = np.abs(Δσ - σ_prev) >= EPS
+
+    sinσ, cosσ = np.sin(σ), np.cos(σ)
+    t = sinU1 * sinσ - cosU1 * cosσ * cosα1
+    φ2 = np.arctan2(sinU1 * cosσ + cosU1 * sinσ * cosα1,
+                    ONE_MINUS_F * np.sqrt(sinα * sinα + t * t))
+    λ = np.arctan2(sinσ * sinα1, cosU1 * cosσ - sinU1 * sinσ * cosα1)
+    L = λ - (1 - C) * f * sinα * (
+        σ + C * sinσ * (cos2σm + C * cosσ * (-1 + 2 * cos2σm * cos2σm))
+    )
+    λ2 = λ1 + L
+    α2 = np.arctan2(sinα, -t)
+    φ2 = np.degrees(φ2)
+    λ2 = normalize_lon_vec(np.degrees(λ2))
+    α2 = normalize_azimuth_vec(np.degrees(α2))
+    φ2[active] = λ2[active] = α2[active] = np.nan
+    return φ2.reshape(shape), λ2.reshape(shape), α2.reshape(shape)
+
+# =========================================================
+# Parallel pairwise distances (Numba gufunc)
+# =========================================================
+def _inverse_gu(lat1, lon1, lat2, lon2, s, α1, α2):
+    s[0], α1[0], α2[0] = _inverse_kernel(lat1, lon1, lat2, lon2)
+
+# Functions _jit() compiles, in dependency order. The module-level originals
+# stay plain Python, so the public helpers keep accepting arrays.
+_JIT_SIGNATURES = (
+    ("normalize_lon", "float64(float64)"),
+    ("normalize_azimuth", "float64(float64)"),
+    ("_inverse_kernel", _SIG_TRIPLE),
+    ("_direct_prep", "UniTuple(float64, 10)(float64, float64, float64)"),
+    ("_direct_step", "UniTuple(float64, 3)(UniTuple(float64, 10), float64)"),
+    ("_direct_kernel", _SIG_TRIPLE),
+)
+_jitted = {}
+
+def _jit():
+    """Numba-compiled kernels and gufunc, built on first call; None without Numba.
+
+    Each kernel is rebuilt over a private copy of the module globals in which
+    the helpers it calls are already compiled, so nothing here is rebound.
+    """
+    if not _HAVE_NUMBA:
+        return None
+    if not _jitted:
+        from numba import guvectorize, njit
+        ns = dict(globals())
+        for name, signature in _JIT_SIGNATURES:
+            fn = ns[name]
+            fn = FunctionType(fn.__code__, ns, fn.__name__, fn.__defaults__, fn.__closure__)
+            ns[name] = njit(signature, cache=True, fastmath=_FASTMATH)(fn)
+        gu = FunctionType(_inverse_gu.__code__, ns, _inverse_gu.__name__)
+        ns["vincenty_inverse_gu"] = guvectorize(
+            ["void(float64, float64, float64, float64, float64[:], float64[:], float64[:])"],
+            "(),(),(),()->(),(),()", target='parallel', cache=True,
+        )(gu)
+        _jitted.update((name, ns[name]) for name, _ in _JIT_SIGNATURES)
+        _jitted["vincenty_inverse_gu"] = ns["vincenty_inverse_gu"]
+    return _jitted
+
+def __getattr__(name):
+    # vincenty_inverse_gu is compiled on first access; None without Numba
+    if name == "vincenty_inverse_gu":
+        jit = _jit()
+        return None if jit is None else jit[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def distance_array(lat1, lon1, lat2, lon2):
+    """Distance and bearings for arrays of point pairs, spread across all cores.
+
+    Inputs broadcast against each other, so one origin against N points works
+    directly. Returns an array of the broadcast shape plus a trailing axis of
+    ``(s, α1, α2)``; pairs that fail to converge are NaN. Without Numba it
+    uses the Cython batch kernel if built, else ``vincenty_inverse_vec``.
+    """
+    jit = _jit()
+    if jit is None and _inverse_batch is not None:
+        arrays = np.broadcast_arrays(lat1, lon1, lat2, lon2)
+        flat = [np.ascontiguousarray(x, dtype=np.float64).ravel() for x in arrays]
+        out = np.empty((flat[0].size, 3))
+        _inverse_batch(*flat, out)
+        return out.reshape(arrays[0].shape + (3,))
+    if jit is None:
+        return np.stack(vincenty_inverse_vec(lat1, lon1, lat2, lon2), axis=-1)
+    shape = np.broadcast_shapes(*(np.shape(x) for x in (lat1, lon1, lat2, lon2)))
+    out = np.empty(shape + (3,))
+    # NaN is the documented result for unconverged pairs, not an FP error
+    with np.errstate(invalid='ignore'):
+        jit["vincenty_inverse_gu"](lat1, lon1, lat2, lon2, out[..., 0], out[..., 1], out[..., 2])
+    return out
+
+# =========================================================
+# Distance matrix (cdist-style)
+# =========================================================
+def distance_matrix(P, Q, max_pairs=1 << 14):
+    """Geodesic distances from every point in ``P`` to every point in ``Q``.
+
+    ``P`` and ``Q`` are ``(N, 2)`` and ``(M, 2)`` arrays of ``(lat, lon)``;
+    a single ``(lat, lon)`` pair counts as one row. Returns an ``(N, M)`` array
+    of metres, like ``scipy.spatial.distance.cdist``.
+    The matrix is filled in tiles of at most ``max_pairs`` pairs, each one run
+    through ``distance_array``, so the working set stays the same size however
+    large ``P`` and ``Q`` are. This is O(N·M) work: for nearest-neighbour
+    queries, shortlist candidates with a haversine ball tree first and refine
+    only those here.
+    """
+    P = np.atleast_2d(np.asarray(P, dtype=np.float64))
+    Q = np.atleast_2d(np.asarray(Q, dtype=np.float64))
+    for name, X in (("P", P), ("Q", Q)):
+        if X.ndim != 2 or X.shape[1] != 2:
+            raise ValueError(f"{name} must be an (N, 2) array of (lat, lon), got shape {X.shape}")
+    n, m = P.shape[0], Q.shape[0]
+    out = np.empty((n, m))
+    cols = max(1, min(m, max_pairs // max(n, 1)))
+    rows = max(1, min(n, max_pairs // cols))
+    for i in range(0, n, rows):
+        p = P[i:i + rows]
+        for j in range(0, m, cols):
+            q = Q[j:j + cols]
+            out[i:i + rows, j:j + cols] = distance_array(
+                p[:, 0, None], p[:, 1, None], q[None, :, 0], q[None, :, 1])[..., 0]
+    return out
 
 # =========================================================
 # Interpolation along the geodesic
@@ -131,26 +493,27 @@ def vincenty_interpolate(lat1, lon1, lat2, lon2, csv_path):
     if not csv_file.is_absolute():
         csv_file = Path(__file__).resolve().parent / "examples" / csv_file
     s_total, α1, α2 = vincenty_inverse(lat1, lon1, lat2, lon2)
-    df = pd.read_csv(csv_file)
+    with open(csv_file, newline='') as fh:
+        rows = [(r['serial no'], float(r['distance'])) for r in csv.DictReader(fh)]
     print(f"Total geodesic distance: {s_total:.3f} m, Initial bearing: {α1:.4f}°")
-    results = []
-    for _, row in df.iterrows():
-        s_i = float(row['distance'])
-        φi, λi, _ = vincenty_direct(lat1, lon1, α1, s_i)
-        results.append({
-            "serial no": row['serial no'],
-            "distance": s_i,
-            "latitude": φi,
-            "longitude": λi
-        })
+    s = np.fromiter((d for _, d in rows), dtype=np.float64, count=len(rows))
+    φ, λ, _ = vincenty_direct_vec(lat1, lon1, α1, s)
     out_file = csv_file.with_name("interpolated_points.csv")
-    pd.DataFrame(results).to_csv(out_file, index=False)
+    with open(out_file, 'w', newline='') as fh:
+        writer = csv.writer(fh, lineterminator='\n')
+        writer.writerow(["serial no", "distance", "latitude", "longitude"])
+        writer.writerows(
+            (serial, f"{d:.3f}", f"{φi:.8f}", f"{λi:.8f}")
+            for (serial, d), φi, λi in zip(rows, φ.tolist(), λ.tolist())
+        )
     print(f"✅ Interpolated points saved: {out_file}")
 
 # =========================================================
 # Command-line Interface
 # =========================================================
 def main():
+    import argparse  # only the CLI needs it; keep library imports lean
+
     parser = argparse.ArgumentParser(
         prog="vincenty.py",
         description="Vincenty Geodesic Toolkit — compute distance, destination, and interpolation on the WGS-84 ellipsoid.",
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vincenty Geodesic Toolkit — CUDA backend
+Vincenty inverse over large batches of point pairs on an NVIDIA GPU (Numba CUDA).
+One thread per pair; each thread iterates until its own pair converges, so no
+inter-thread synchronisation is needed and short pairs simply idle while the
+warp finishes its slowest member.
+"""
+
+import math
+
+import numpy as np
+from numba import cuda
+
+from vincenty import EP2, EPS, F_16, MAX_ITER, ONE_MINUS_F, STALL_ITER, STALL_RATIO, b, f
+
+THREADS_PER_BLOCK = 256
+
+# =========================================================
+# Device kernel
+# =========================================================
+@cuda.jit(device=True)
+def _inverse_device(lat1, lon1, lat2, lon2):
+    L = math.radians(lon2 - lon1)
+    tanU1 = ONE_MINUS_F * math.tan(math.radians(lat1))
+    tanU2 = ONE_MINUS_F * math.tan(math.radians(lat2))
+    cosU1 = 1 / math.sqrt(1 + tanU1 * tanU1)
+    cosU2 = 1 / math.sqrt(1 + tanU2 * tanU2)
+    sinU1, sinU2 = tanU1 * cosU1, tanU2 * cosU2
+    cU1cU2, sU1sU2 = cosU1 * cosU2, sinU1 * sinU2
+    sU1cU2, cU1sU2 = sinU1 * cosU2, cosU1 * sinU2
+    λ = L
+    sinσ = cosσ = σ = cos2α = cos2σm = sinλ = 0.0
+    cosλ = 1.0
+    Δλ_prev = math.inf
+    stalled = 0
+    converged = False
+    for it in range(MAX_ITER):
+        sinλ, cosλ = math.sin(λ), math.cos(λ)
+        t = cU1sU2 - sU1cU2 * cosλ
+        sinσ = math.sqrt((cosU2 * sinλ) * (cosU2 * sinλ) + t * t)
+        if sinσ == 0:
+            return 0.0, 0.0, 0.0
+        cosσ = sU1sU2 + cU1cU2 * cosλ
+        σ = math.atan2(sinσ, cosσ)
+        sinα = cU1cU2 * sinλ / sinσ
+        cos2α = 1 - sinα * sinα
+        cos2σm = 0.0 if cos2α == 0 else cosσ - 2 * sU1sU2 / cos2α
+        C = F_16 * cos2α * (4 + f * (4 - 3 * cos2α))
+        λ_prev = λ
+        λ = L + (1 - C) * f * sinα * (
+            σ + C * sinσ * (cos2σm + C * cosσ * (-1 + 2 * cos2σm * cos2σm))
+        )
+        Δλ = abs(λ - λ_prev)
+        if Δλ < EPS:
+            converged = True
+            break
+        # No-progress exit, same rule as vincenty.py; frees the warp sooner
+        stalled = stalled + 1 if Δλ > STALL_RATIO * Δλ_prev else 0
+        if stalled >= STALL_ITER and Δλ * STALL_RATIO ** (MAX_ITER - 1 - it) >= EPS:
+            break
+        Δλ_prev = Δλ
+    if not converged:
+        return math.nan, math.nan, math.nan
+
+    u2 = cos2α * EP2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    Δσ = B * sinσ * (
+        cos2σm + B / 4 * (cosσ * (-1 + 2 * cos2σm * cos2σm)
+        - B / 6 * cos2σm * (-3 + 4 * sinσ * sinσ) * (-3 + 4 * cos2σm * cos2σm))
+    )
+    s = b * A * (σ - Δσ)
+    # sinλ/cosλ from the last iteration: λ has moved by less than EPS since
+    α1 = math.atan2(cosU2 * sinλ, cU1sU2 - sU1cU2 * cosλ)
+    α2 = math.atan2(cosU1 * sinλ, -sU1cU2 + cU1sU2 * cosλ)
+    return s, math.degrees(α1) % 360.0, math.degrees(α2) % 360.0
+
+@cuda.jit
+def inverse_kernel(lat1, lon1, lat2, lon2, out_s, out_a1, out_a2):
+    i = cuda.grid(1)
+    if i >= lat1.size:
+        return
+    out_s[i], out_a1[i], out_a2[i] = _inverse_device(lat1[i], lon1[i], lat2[i], lon2[i])
+
+# =========================================================
+# Host wrapper
+# =========================================================
+def vincenty_inverse_cuda(lat1, lon1, lat2, lon2):
+    """Vincenty inverse on the GPU for arrays of point pairs.
+
+    Inputs broadcast against each other; returns host ``(s, α1, α2)`` arrays
+    of the broadcast shape. Pairs that fail to converge are NaN.
+    """
+    arrays = np.broadcast_arrays(lat1, lon1, lat2, lon2)
+    shape = arrays[0].shape
+    d_in = [cuda.to_device(np.ascontiguousarray(x, dtype=np.float64).ravel())
+            for x in arrays]
+    n = d_in[0].size
+    if n == 0:
+        return tuple(np.empty(shape) for _ in range(3))
+    d_out = [cuda.device_array(n, dtype=np.float64) for _ in range(3)]
+    blocks = (n + THREADS_PER_BLOCK - 1) // THREADS_PER_BLOCK
+    inverse_kernel[blocks, THREADS_PER_BLOCK](*d_in, *d_out)
+    return tuple(d.copy_to_host().reshape(shape) for d in d_out)
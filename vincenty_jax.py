@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Vincenty Geodesic Toolkit — JAX backend
+Vincenty inverse as a jit-compiled, vmapped JAX function, so the same code
+runs batched on CPU, GPU or TPU inside a JAX pipeline.
+"""
+
+import jax
+import jax.numpy as jnp
+from jax import lax
+
+from vincenty import EP2, EPS, F_16, MAX_ITER, ONE_MINUS_F, STALL_ITER, STALL_RATIO, b, f
+
+# =========================================================
+# Single-pair kernel
+# =========================================================
+def _inverse_jax(lat1, lon1, lat2, lon2):
+    L = jnp.radians(lon2 - lon1)
+    tanU1 = ONE_MINUS_F * jnp.tan(jnp.radians(lat1))
+    tanU2 = ONE_MINUS_F * jnp.tan(jnp.radians(lat2))
+    cosU1 = 1 / jnp.sqrt(1 + tanU1 * tanU1)
+    cosU2 = 1 / jnp.sqrt(1 + tanU2 * tanU2)
+    sinU1, sinU2 = tanU1 * cosU1, tanU2 * cosU2
+    cU1cU2, sU1sU2 = cosU1 * cosU2, sinU1 * sinU2
+    sU1cU2, cU1sU2 = sinU1 * cosU2, cosU1 * sinU2
+
+    def cond_fn(state):
+        i, _, Δλ, _, gave_up, _ = state
+        return (i < MAX_ITER) & (Δλ >= EPS) & ~gave_up
+
+    def body_fn(state):
+        i, λ, Δλ_prev, stalled, _, _ = state
+        sinλ, cosλ = jnp.sin(λ), jnp.cos(λ)
+        sinσ = jnp.hypot(cosU2 * sinλ, cU1sU2 - sU1cU2 * cosλ)
+        cosσ = sU1sU2 + cU1cU2 * cosλ
+        σ = jnp.arctan2(sinσ, cosσ)
+        # Coincident points give sinσ == 0; keep the lanes finite and zero them at the end
+        sinα = cU1cU2 * sinλ / jnp.where(sinσ == 0, 1.0, sinσ)
+        cos2α = 1 - sinα * sinα
+        cos2σm = jnp.where(cos2α == 0, 0.0,
+                           cosσ - 2 * sU1sU2 / jnp.where(cos2α == 0, 1.0, cos2α))
+        C = F_16 * cos2α * (4 + f * (4 - 3 * cos2α))
+        λ_new = L + (1 - C) * f * sinα * (
+            σ + C * sinσ * (cos2σm + C * cosσ * (-1 + 2 * cos2σm * cos2σm))
+        )
+        Δλ = jnp.abs(λ_new - λ)
+        # No-progress exit, same rule as vincenty.py
+        stalled = jnp.where(Δλ > STALL_RATIO * Δλ_prev, stalled + 1, 0)
+        gave_up = (Δλ >= EPS) & (stalled >= STALL_ITER) & (
+            Δλ * STALL_RATIO ** (MAX_ITER - 1 - i) >= EPS)
+        return i + 1, λ_new, Δλ, stalled, gave_up, (sinσ, cosσ, σ, cos2α, cos2σm)
+
+    zero = jnp.zeros_like(L)
+    init = (0, L, jnp.full_like(L, jnp.inf), jnp.zeros_like(L, dtype=int), jnp.zeros_like(L, dtype=bool),
+            (zero, zero, zero, zero, zero))
+    _, λ, Δλ, _, _, (sinσ, cosσ, σ, cos2α, cos2σm) = lax.while_loop(cond_fn, body_fn, init)
+
+    u2 = cos2α * EP2
+    A = 1 + u2 / 16384 * (4096 + u2 * (-768 + u2 * (320 - 175 * u2)))
+    B = u2 / 1024 * (256 + u2 * (-128 + u2 * (74 - 47 * u2)))
+    Δσ = B * sinσ * (
+        cos2σm + B / 4 * (cosσ * (-1 + 2 * cos2σm * cos2σm)
+        - B / 6 * cos2σm * (-3 + 4 * sinσ * sinσ) * (-3 + 4 * cos2σm * cos2σm))
+    )
+    s = b * A * (σ - Δσ)
+    sinλ, cosλ = jnp.sin(λ), jnp.cos(λ)
+    α1 = jnp.degrees(jnp.arctan2(cosU2 * sinλ, cU1sU2 - sU1cU2 * cosλ)) % 360.0
+    α2 = jnp.degrees(jnp.arctan2(cosU1 * sinλ, -sU1cU2 + cU1sU2 * cosλ)) % 360.0
+    out = jnp.stack([s, α1, α2])
+    out = jnp.where(sinσ == 0, 0.0, out)
+    return jnp.where(Δλ < EPS, out, jnp.nan)
+
+# =========================================================
+# Batched entry point
+# =========================================================
+# Under vmap the while_loop keeps running until every lane has converged;
+# finished lanes are carried along unchanged.
+_inverse_batch = jax.jit(jax.vmap(_inverse_jax))
+
+def inverse_batch(lat1, lon1, lat2, lon2):
+    """Vincenty inverse for 1-D arrays of point pairs.
+
+    Returns an ``(N, 3)`` array of ``(s, α1, α2)``; pairs that fail to converge
+    are NaN. Sub-millimetre Vincenty needs double precision, so JAX's 64-bit
+    mode must be on (``jax.config.update("jax_enable_x64", True)`` at startup);
+    this module does not flip that process-wide setting itself.
+    """
+    if not jax.config.jax_enable_x64:
+        raise RuntimeError(
+            "vincenty_jax needs 64-bit floats; enable them with "
+            "jax.config.update('jax_enable_x64', True) before calling inverse_batch")
+    return _inverse_batch(lat1, lon1, lat2, lon2)